@@ -32,9 +32,18 @@ class ConfigHandler:
         """Gets a configuration value."""
         return self.config.get(section, {}).get(key, default)
 
-    def set(self, section, key, value):
-        """Sets a configuration value and saves the file."""
+    def snapshot(self):
+        """
+        Returns a copy of the configuration for bulk reads. Sections are copied one level
+        deep (values are plain scalars), which is far cheaper than a recursive deepcopy.
+        """
+        return {section: dict(values) if isinstance(values, dict) else values
+                for section, values in self.config.items()}
+
+    def set(self, section, key, value, save=True):
+        """Sets a configuration value and saves the file (pass save=False to batch writes)."""
         if section not in self.config:
             self.config[section] = {}
         self.config[section][key] = value
-        self.save_config()
+        if save:
+            self.save_config()
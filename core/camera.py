@@ -12,6 +12,7 @@ class CameraStream:
         self.is_running = False
         self.is_paused = False
         self.current_frame = None
+        self.frame_id = 0  # Incremented for every new frame stored
         self.lock = threading.Lock()
         self.thread = None
 
@@ -51,6 +52,7 @@ class CameraStream:
                     if not self.is_paused:
                         with self.lock:
                             self.current_frame = frame
+                            self.frame_id += 1
                 else:
                     print("Warning: Failed to read frame from camera.")
             
@@ -70,6 +72,16 @@ class CameraStream:
                 return self.current_frame.copy()
             return None
 
+    def read_with_id(self):
+        """Returns the most recent frame along with its sequence number."""
+        if self.is_paused:
+            return None, self.frame_id
+
+        with self.lock:
+            if self.current_frame is not None:
+                return self.current_frame.copy(), self.frame_id
+            return None, self.frame_id
+
     def pause(self):
         self.is_paused = True
 
@@ -6,9 +6,17 @@ class YoloV8Engine:
     def __init__(self, model_path="models/yolov8n.onnx"):
         # We attempt to use DirectML for GPU acceleration on Windows, falling back to CPU if unavailable.
         providers = ['DmlExecutionProvider', 'CPUExecutionProvider']
+
+        sess_options = ort.SessionOptions()
+        if 'DmlExecutionProvider' in ort.get_available_providers():
+            # DirectML requires memory patterns off and sequential execution
+            sess_options.enable_mem_pattern = False
+            sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        else:
+            sess_options.enable_mem_pattern = True
         
         try:
-            self.session = ort.InferenceSession(model_path, providers=providers)
+            self.session = ort.InferenceSession(model_path, sess_options=sess_options, providers=providers)
             print(f"ONNX Runtime initialized with providers: {self.session.get_providers()}")
         except Exception as e:
             print(f"Failed to load ONNX model at {model_path}. Error: {e}")
@@ -24,6 +32,10 @@ class YoloV8Engine:
 
         self.output_names = [output.name for output in self.session.get_outputs()]
 
+        # Persistent buffers so preprocessing doesn't allocate per frame
+        self._rgb_buf = np.empty((self.input_height, self.input_width, 3), dtype=np.uint8)
+        self._input_buf = np.empty((1, 3, self.input_height, self.input_width), dtype=np.float32)
+
         # COCO class ID for cell phone is 67
         self.target_class_id = 67 
 
@@ -47,24 +59,20 @@ class YoloV8Engine:
     def _preprocess(self, image):
         """
         Prepares the OpenCV BGR image for YOLOv8 inference.
-        Letterbox Resize -> Convert BGR to RGB -> Normalize -> Transpose -> Add batch dimension
+        Letterbox Resize -> Convert BGR to RGB -> Normalize + Transpose into the batched input buffer
+        Everything runs in OpenCV/NumPy C code, so the GIL is released for most of it.
+        The returned tensor is reused by the next call.
         """
         # 1. Letterbox resize image to model input shape preserving aspect ratio
-        img, ratio, pad = self._letterbox(image, new_shape=(self.input_width, self.input_height))
+        img, ratio, pad = self._letterbox(image, new_shape=(self.input_height, self.input_width))
         
         # 2. Convert from BGR (OpenCV default) to RGB
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        
-        # 3. Normalize intensity values (0-255 -> 0.0-1.0)
-        img = img.astype(np.float32) / 255.0
+        cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         
-        # 4. HWC (Height, Width, Channels) to CHW (Channels, Height, Width)
-        img = np.transpose(img, (2, 0, 1))
+        # 3. Normalize (0-255 -> 0.0-1.0) while transposing HWC -> CHW straight into the BCHW tensor
+        np.multiply(self._rgb_buf.transpose(2, 0, 1), np.float32(1.0 / 255.0), out=self._input_buf[0])
         
-        # 5. Add batch dimension (BCHW)
-        img = np.expand_dims(img, axis=0)
-        
-        return img, ratio, pad
+        return self._input_buf, ratio, pad
 
     def _postprocess(self, outputs, orig_img_shape):
         """
@@ -72,26 +80,14 @@ class YoloV8Engine:
         YOLOv8 output shape is typically [batch_size, num_classes + 4, num_anchors]
         E.g., for COCO (80 classes) it is [1, 84, 8400]
         """
-        predictions = outputs[0]  # Take the first batch
-        
-        # Transpose to [num_anchors, 84] for easier iteration
-        predictions = np.transpose(predictions, (0, 2, 1))[0] 
+        predictions = outputs[0][0]  # First batch, [84, num_anchors]
         
-        best_confidence = 0.0
-        detected = False
-        
-        for pred in predictions:
-            # Classes start at index 4 (0: x, 1: y, 2: w, 3: h)
-            class_scores = pred[4:]
-            
-            # For performance, we can just check our target class directly
-            if len(class_scores) > self.target_class_id:
-                phone_score = class_scores[self.target_class_id]
-                if phone_score > best_confidence:
-                    best_confidence = phone_score
-                    detected = True
+        # Classes start at row 4 (0: x, 1: y, 2: w, 3: h); only our target class row matters
+        if predictions.shape[0] <= 4 + self.target_class_id:
+            return False, 0.0
 
-        return detected, float(best_confidence)
+        best_confidence = float(predictions[4 + self.target_class_id].max())
+        return best_confidence > 0.0, max(best_confidence, 0.0)
 
 
     def detect(self, frame):
@@ -119,10 +115,10 @@ class YoloV8Engine:
         """
         Runs detection and returns bounding boxes for all threat-class objects.
         Returns (detected, best_confidence, threat_boxes)
-        where threat_boxes is a list of (x1, y1, x2, y2) in original frame coords.
+        where threat_boxes is an (N, 4) int32 array of (x1, y1, x2, y2) in original frame coords.
         """
         if self.session is None or frame is None:
-            return False, 0.0, []
+            return False, 0.0, np.empty((0, 4), dtype=np.int32)
 
         if conf_threshold is None:
             conf_threshold = 0.25
@@ -133,35 +129,39 @@ class YoloV8Engine:
             outputs = self.session.run(self.output_names, {self.input_name: input_tensor})
         except Exception as e:
             print(f"Inference error: {e}")
-            return False, 0.0, []
+            return False, 0.0, np.empty((0, 4), dtype=np.int32)
 
-        predictions = np.transpose(outputs[0], (0, 2, 1))[0]
-        orig_h, orig_w = frame.shape[:2]
-        pad_w, pad_h = pad
+        return self._postprocess_boxes(outputs, frame.shape, ratio, pad, conf_threshold)
 
-        best_conf = 0.0
-        detected = False
-        threat_boxes = []
-
-        for pred in predictions:
-            x_c, y_c, bw, bh = pred[0], pred[1], pred[2], pred[3]
-            class_scores = pred[4:]
-
-            if len(class_scores) <= self.target_class_id:
-                continue
-
-            score = float(class_scores[self.target_class_id])
-            if score < conf_threshold:
-                continue
-
-            detected = True
-            if score > best_conf:
-                best_conf = score
-
-            x1 = max(0, int((x_c - bw / 2 - pad_w) / ratio))
-            y1 = max(0, int((y_c - bh / 2 - pad_h) / ratio))
-            x2 = min(orig_w, int((x_c + bw / 2 - pad_w) / ratio))
-            y2 = min(orig_h, int((y_c + bh / 2 - pad_h) / ratio))
-            threat_boxes.append((x1, y1, x2, y2))
+    def _postprocess_boxes(self, outputs, orig_img_shape, ratio, pad, conf_threshold):
+        """
+        Turns raw YOLOv8 outputs into target-class boxes in original frame coords.
+        Returns (detected, best_confidence, threat_boxes) like detect_with_boxes.
+        """
+        predictions = outputs[0][0]  # First batch, [84, num_anchors]
+        orig_h, orig_w = orig_img_shape[:2]
+        pad_w, pad_h = pad
 
-        return detected, best_conf, threat_boxes
+        if predictions.shape[0] <= 4 + self.target_class_id:
+            return False, 0.0, np.empty((0, 4), dtype=np.int32)
+
+        scores = predictions[4 + self.target_class_id]
+        keep = scores >= conf_threshold
+        if not keep.any():
+            return False, 0.0, np.empty((0, 4), dtype=np.int32)
+
+        x_c, y_c, bw, bh = predictions[:4, keep]
+        best_conf = float(scores[keep].max())
+
+        # Undo the letterbox, then truncate to pixel coords and clamp to the frame
+        threat_boxes = np.stack([
+            (x_c - bw / 2 - pad_w) / ratio,
+            (y_c - bh / 2 - pad_h) / ratio,
+            (x_c + bw / 2 - pad_w) / ratio,
+            (y_c + bh / 2 - pad_h) / ratio,
+        ], axis=1).astype(np.int32)
+        np.maximum(threat_boxes[:, :2], 0, out=threat_boxes[:, :2])
+        np.minimum(threat_boxes[:, 2], orig_w, out=threat_boxes[:, 2])
+        np.minimum(threat_boxes[:, 3], orig_h, out=threat_boxes[:, 3])
+
+        return True, best_conf, threat_boxes
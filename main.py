@@ -104,10 +104,13 @@ class LensBlockApp:
         self.dashboard.restart_engine_requested.connect(self.controller.request_engine_restart)
         self.dashboard.mode_changed.connect(self._on_mode_changed)
         self.dashboard.debug_view_requested.connect(self._on_debug_toggled)
+        self.dashboard.visibility_changed.connect(self.controller.set_preview_enabled)
         self.controller.censored_frame_ready.connect(self._on_censored_frame)
         self.controller.debug_frame_ready.connect(self.debug_window.update_frame)
+        self.controller.incident_logged.connect(self.dashboard.invalidate_log_cache)
+        self.debug_window.target_size_changed.connect(self.controller.set_debug_target)
 
-    def _on_threat_detected(self, is_active, remaining_seconds):
+    def _on_threat_detected(self, is_active, lockout_seconds):
         """Fired in UI scale when controller toggles."""
         if self.manually_unlocked:
             return  # Suppress signals while manually overridden
@@ -118,24 +121,26 @@ class LensBlockApp:
             
         if is_active:
             # Trigger full-screen blackout lock
-            self.shield.trigger_shield(True, remaining_seconds)
-            self.dashboard.status_label.setText("System Status: LOCKDOWN")
-            self.dashboard.status_label.setStyleSheet("color: #FF3333; font-weight: bold; font-size: 16px;")
+            self.shield.lock_for(lockout_seconds)
+            # Re-sent on every sighting to extend the lock; only restyle the label on entry
+            if self.dashboard.status_label.text() != "System Status: LOCKDOWN":
+                self.dashboard.status_label.setText("System Status: LOCKDOWN")
+                self.dashboard.status_label.setStyleSheet("color: #FF3333; font-weight: bold; font-size: 16px;")
         else:
             # Dissolve lock
-            self.shield.trigger_shield(False, 0)
+            self.shield.trigger_shield(False)
             self.dashboard.status_label.setText("System Status: ARMED")
             self.dashboard.status_label.setStyleSheet("color: #4caf50; font-weight: bold; font-size: 16px;")
 
-    def _on_frame_ready(self, cv_frame):
-        """If dashboard is open, stream frame to UI."""
+    def _on_frame_ready(self, preview_img):
+        """If dashboard is open, stream the preview image to UI."""
         if self.dashboard.isVisible():
-            self.dashboard.update_frame(cv_frame)
+            self.dashboard.update_frame(preview_img)
 
-    def _on_censored_frame(self, sanitized_frame):
+    def _on_censored_frame(self, preview_img):
         """When in censorship mode, show the sanitized feed in the dashboard preview."""
         if self.dashboard.isVisible():
-            self.dashboard.update_frame(sanitized_frame)
+            self.dashboard.update_frame(preview_img)
 
     def _on_mode_changed(self, mode_str):
         """Handle protection mode toggle from the dashboard."""
@@ -0,0 +1,84 @@
+"""
+Numba-compiled helpers for the controller's per-frame numeric hot loops.
+Numba is an optional dependency: when it is not installed, JIT_AVAILABLE is
+False and the controller keeps using its plain Python loops.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    JIT_AVAILABLE = True
+except ImportError:
+    JIT_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the definitions below still import without Numba."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def iou_scalar(ax1, ay1, ax2, ay2, bx1, by1, bx2, by2):
+    """Intersection over Union between two boxes given as unpacked coordinates."""
+    xa = max(ax1, bx1)
+    ya = max(ay1, by1)
+    xb = min(ax2, bx2)
+    yb = min(ay2, by2)
+    inter = max(0.0, xb - xa) * max(0.0, yb - ya)
+    area_a = (ax2 - ax1) * (ay2 - ay1)
+    area_b = (bx2 - bx1) * (by2 - by1)
+    union = area_a + area_b - inter
+    return inter / union if union > 0 else 0.0
+
+
+@njit(cache=True)
+def match_tracks(dets_xyxy, tracks_xyxy, iou_thresh):
+    """
+    Greedily matches each detection to the existing track with the highest IoU.
+
+    Mirrors the controller's Python loop exactly: detections are visited in
+    order, a matched track takes over the detection's box, and an unmatched
+    detection opens a new track that later detections may match against.
+
+    Returns an int64 array of length N holding the slot each detection landed
+    in. Slots below len(tracks_xyxy) are existing tracks; higher slots are new
+    tracks in order of creation.
+    """
+    n_dets = dets_xyxy.shape[0]
+    n_tracks = tracks_xyxy.shape[0]
+
+    # Scratch holds the existing tracks plus room for every detection to open a new one
+    scratch = np.empty((n_tracks + n_dets, 4), dtype=np.float64)
+    for i in range(n_tracks):
+        for k in range(4):
+            scratch[i, k] = tracks_xyxy[i, k]
+    n_slots = n_tracks
+
+    slots = np.empty(n_dets, dtype=np.int64)
+    for d in range(n_dets):
+        dx1 = float(dets_xyxy[d, 0])
+        dy1 = float(dets_xyxy[d, 1])
+        dx2 = float(dets_xyxy[d, 2])
+        dy2 = float(dets_xyxy[d, 3])
+
+        best_iou = 0.0
+        best_slot = -1
+        for s in range(n_slots):
+            iou = iou_scalar(dx1, dy1, dx2, dy2,
+                             scratch[s, 0], scratch[s, 1], scratch[s, 2], scratch[s, 3])
+            if iou > best_iou:
+                best_iou = iou
+                best_slot = s
+
+        if best_iou <= iou_thresh or best_slot < 0:
+            best_slot = n_slots
+            n_slots += 1
+
+        scratch[best_slot, 0] = dx1
+        scratch[best_slot, 1] = dy1
+        scratch[best_slot, 2] = dx2
+        scratch[best_slot, 3] = dy2
+        slots[d] = best_slot
+
+    return slots
@@ -3,10 +3,12 @@ import cv2
 import numpy as np
 from enum import Enum
 from PyQt6.QtCore import QObject, pyqtSignal as Signal, QThread
+from PyQt6.QtGui import QImage
 from config import ConfigHandler
 from security.logger import ThreatLogger
 from core.engine import YoloV8Engine
 from core.camera import CameraStream
+from security._jit import JIT_AVAILABLE, match_tracks
 
 try:
     import pyvirtualcam
@@ -25,11 +27,12 @@ class SecurityController(QThread):
     inference loop, and threat persistence logic.
     Emits signals safely to the main GUI thread.
     """
-    # Emits (is_threat_active, remaining_lockout_seconds)
-    threat_detected = Signal(bool, int)
-    frame_ready = Signal(object)           # For updating the dashboard preview
-    censored_frame_ready = Signal(object)  # Censored frame for vcam preview
+    # Emits (is_threat_active, lockout_seconds) on entry and whenever the lockout deadline moves
+    threat_detected = Signal(bool, float)
+    frame_ready = Signal(object)           # Blurred preview QImage for the dashboard
+    censored_frame_ready = Signal(object)  # Blurred preview QImage of the censored (vcam) feed
     debug_frame_ready = Signal(object)     # For the separate Debug View window
+    incident_logged = Signal()             # A new row was written to the audit log
 
     def __init__(self, config: ConfigHandler, logger: ThreatLogger):
         super().__init__()
@@ -59,6 +62,28 @@ class SecurityController(QThread):
         self._last_censored_frame = None  # Frame-drop fallback
         self._censor_cooldown_frames = 10
         self._roi_padding = 0.20    # 20% expansion
+        self._last_detect_boxes = np.empty((0, 4), dtype=np.int32)
+        self._last_detect_conf = 0.0
+        self._last_detect_frame_id = None  # Camera frame the cached detections belong to
+        self._detect_reuse_count = 0
+        self._max_detect_reuse = 5        # Re-infer at least this often even on a stalled feed
+        self._iou_match_threshold = 0.3
+
+        # Preview throttling: the dashboard thumbnail doesn't need camera rate
+        self._preview_period = 1.0 / 15
+        self._last_preview_emit = 0.0
+        self._preview_due = True
+        self._preview_size = (320, 180)  # Matches the dashboard's fixed preview label
+        self.preview_enabled = False     # Toggled as the dashboard is shown/hidden
+        self._preview_small = None
+        self._preview_blur = None
+        self._preview_meta = None  # (source (h, w), preview w, preview h, bytes per line)
+        self._last_debug_emit = 0.0  # Debug View frames share the preview rate
+        self._debug_target = None  # (width, height) published by the Debug View
+
+        # Reused buffers for the virtual camera broadcast
+        self._vcam_rgb = None
+        self._vcam_bgr = None
 
     def get_settings(self):
         """Fetches dynamic settings that the user might have updated."""
@@ -75,6 +100,12 @@ class SecurityController(QThread):
             return
 
         self.is_running = True
+
+        if JIT_AVAILABLE:
+            # Compile the matcher now rather than on the first censorship frame, where
+            # a cold cache would stall the preview and vcam while holding the GIL
+            match_tracks(np.empty((0, 4), dtype=np.int32), np.empty((0, 4), dtype=np.float64),
+                         self._iou_match_threshold)
         
         # Initialize virtual camera for broadcasting to Zoom/Teams
         vcam = None
@@ -87,18 +118,22 @@ class SecurityController(QThread):
                 vcam = None
         
         while self.is_running:
+            self._preview_due = (time.monotonic() - self._last_preview_emit) >= self._preview_period
+
             if self.pending_camera_restart:
                 camera_idx = self.config.get('system', 'camera_index', 0)
                 print(f"Restarting camera with index: {camera_idx}")
                 self.camera.stop()
                 self.camera = CameraStream(camera_index=camera_idx)
                 self.camera.start()
+                self._last_detect_frame_id = None
                 self.pending_camera_restart = False
             
             if self.pending_model_restart:
                 model_path = self.config.get('detection', 'model_path', 'models/yolov8n.onnx')
                 print(f"Restarting engine with model: {model_path}")
                 self.engine = YoloV8Engine(model_path=model_path)
+                self._last_detect_frame_id = None
                 self.pending_model_restart = False
 
             # We need the RAW frame for the virtual camera when paused,
@@ -115,106 +150,92 @@ class SecurityController(QThread):
                     detected, confidence, boxes = self.engine.detect_with_boxes(frame, conf_threshold=threshold)
                     fps = 1.0 / max(0.001, time.time() - t_start)
                     
-                    debug_frame = frame.copy()
-                    
-                    # Draw YOLO boxes
-                    for (x1, y1, x2, y2) in boxes:
-                        cv2.rectangle(debug_frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-                        cv2.putText(debug_frame, f"Conf: {confidence:.2f}", (x1, max(0, y1-5)), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-                    
-                    # Draw OSD info
-                    cv2.putText(debug_frame, f"FPS: {fps:.1f}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 255), 2)
-                    cv2.putText(debug_frame, f"Dets: {len(boxes)} | Thresh: {threshold:.2f}", (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 255), 2)
-                    cv2.putText(debug_frame, "PROTECTION PAUSED", (10, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-                    
-                    self.debug_frame_ready.emit(debug_frame)
+                    # Annotate, resize and send only at the preview rate; the rest would be dropped anyway
+                    now = time.monotonic()
+                    if now - self._last_debug_emit >= self._preview_period:
+                        self._last_debug_emit = now
+                        debug_frame = frame.copy()
+                        
+                        # Draw YOLO boxes
+                        for (x1, y1, x2, y2) in boxes.tolist():
+                            cv2.rectangle(debug_frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
+                            cv2.putText(debug_frame, f"Conf: {confidence:.2f}", (x1, max(0, y1-5)), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+                        
+                        # Draw OSD info
+                        cv2.putText(debug_frame, f"FPS: {fps:.1f}", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 255), 2)
+                        cv2.putText(debug_frame, f"Dets: {len(boxes)} | Thresh: {threshold:.2f}", (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 255), 2)
+                        cv2.putText(debug_frame, "PROTECTION PAUSED", (10, 90), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+                        
+                        self.debug_frame_ready.emit(self._fit_debug_frame(debug_frame))
                     
                     # Also keep the dashboard preview and vcam flowing
-                    self.frame_ready.emit(frame)
+                    self._emit_preview(self.frame_ready, frame)
                     raw_frame = frame
                     
                     if self.is_threat_active:
                         self._resolve_threat_cleanly()
             
             elif self.monitoring_active:
-                frame = self.camera.read()
+                frame, frame_id = self.camera.read_with_id()
                 if frame is not None:
-                    # Emit raw frame for dashboard preview
-                    self.frame_ready.emit(frame)
-
                     if self.protection_mode == ProtectionMode.CENSORSHIP:
                         # --- CENSORSHIP MODE with temporal buffer ---
                         threshold = self.get_settings()[0]
                         
-                        # Time the inference for frame-drop prevention
-                        t_start = time.time()
-                        detected, confidence, boxes = self.engine.detect_with_boxes(frame, conf_threshold=threshold)
-                        inference_ms = (time.time() - t_start) * 1000
+                        if (frame_id == self._last_detect_frame_id
+                                and self._detect_reuse_count < self._max_detect_reuse):
+                            # Camera hasn't delivered a new frame: reuse the last detections
+                            boxes = self._last_detect_boxes
+                            confidence = self._last_detect_conf
+                            detected = len(boxes) > 0
+                            self._detect_reuse_count += 1
+                            inference_ms = 0.0
+                        else:
+                            # Time the inference for frame-drop prevention
+                            t_start = time.time()
+                            detected, confidence, boxes = self.engine.detect_with_boxes(frame, conf_threshold=threshold)
+                            inference_ms = (time.time() - t_start) * 1000
+                            self._last_detect_boxes = boxes
+                            self._last_detect_conf = confidence
+                            self._last_detect_frame_id = frame_id
+                            self._detect_reuse_count = 0
+                        
+                        # --- 1. Update threat memory with IoU matching ---
+                        # Done even on overrun so the temporal buffer still sees these boxes
+                        matched_ids = self._match_threats(boxes)
+                        
+                        # Age unmatched threats
+                        expired = []
+                        for tid, tdata in self._active_threats.items():
+                            if tid not in matched_ids:
+                                tdata["cooldown"] += 1
+                                if tdata["cooldown"] > self._censor_cooldown_frames:
+                                    expired.append(tid)
+                        for tid in expired:
+                            del self._active_threats[tid]
                         
                         # If inference took too long, use the last safe frame
                         if inference_ms > 50 and self._last_censored_frame is not None:
-                            self.censored_frame_ready.emit(self._last_censored_frame)
+                            self._emit_preview(self.censored_frame_ready, self._last_censored_frame)
                             raw_frame = self._last_censored_frame
                         else:
-                            # --- 1. Update threat memory with IoU matching ---
-                            matched_ids = set()
-                            for box in boxes:
-                                best_iou = 0.0
-                                best_id = None
-                                for tid, tdata in self._active_threats.items():
-                                    iou = self._compute_iou(box, tdata["box"])
-                                    if iou > best_iou:
-                                        best_iou = iou
-                                        best_id = tid
-                                
-                                if best_iou > 0.3 and best_id is not None:
-                                    # Update existing threat
-                                    self._active_threats[best_id]["box"] = box
-                                    self._active_threats[best_id]["cooldown"] = 0
-                                    matched_ids.add(best_id)
-                                else:
-                                    # New threat
-                                    self._active_threats[self._next_threat_id] = {"box": box, "cooldown": 0}
-                                    matched_ids.add(self._next_threat_id)
-                                    self._next_threat_id += 1
-                            
-                            # Age unmatched threats
-                            expired = []
-                            for tid, tdata in self._active_threats.items():
-                                if tid not in matched_ids:
-                                    tdata["cooldown"] += 1
-                                    if tdata["cooldown"] > self._censor_cooldown_frames:
-                                        expired.append(tid)
-                            for tid in expired:
-                                del self._active_threats[tid]
-                            
                             # --- 2. Build censored frame from all active threats ---
                             sanitized = raw_frame.copy() if raw_frame is not None else frame.copy()
                             fh, fw = sanitized.shape[:2]
                             
-                            for tdata in self._active_threats.values():
-                                x1, y1, x2, y2 = tdata["box"]
-                                
-                                # ROI padding (20% expansion)
-                                bw = x2 - x1
-                                bh = y2 - y1
-                                pad_x = int(bw * self._roi_padding)
-                                pad_y = int(bh * self._roi_padding)
-                                x1 = max(0, x1 - pad_x)
-                                y1 = max(0, y1 - pad_y)
-                                x2 = min(fw, x2 + pad_x)
-                                y2 = min(fh, y2 + pad_y)
-                                
+                            # ROI padding (20% expansion), clamped for all threats at once
+                            for x1, y1, x2, y2 in self._padded_rois(fw, fh).tolist():
                                 # Heavy triple-stacked blur (irreversible by AI sharpening)
+                                # Blurred in place on the ROI view: OpenCV writes through the
+                                # row stride and drops the GIL per pass, so there are no
+                                # temporaries and no copy back into the frame.
                                 roi = sanitized[y1:y2, x1:x2]
                                 if roi.size > 0:
-                                    blurred = cv2.GaussianBlur(roi, (99, 99), 0)
-                                    blurred = cv2.GaussianBlur(blurred, (99, 99), 0)
-                                    blurred = cv2.GaussianBlur(blurred, (99, 99), 0)
-                                    sanitized[y1:y2, x1:x2] = blurred
+                                    for _ in range(3):
+                                        cv2.GaussianBlur(roi, (99, 99), 0, dst=roi)
                             
                             self._last_censored_frame = sanitized
-                            self.censored_frame_ready.emit(sanitized)
+                            self._emit_preview(self.censored_frame_ready, sanitized)
                             raw_frame = sanitized
                         
                         # Log if detected (but DON'T trigger the shield)
@@ -233,11 +254,14 @@ class SecurityController(QThread):
                                 _, _, log_enabled, _ = self.get_settings()
                                 if log_enabled:
                                     self.logger.log_threat("Cell phone visual intrusion (censored)", self.max_threat_confidence, duration)
+                                    self.incident_logged.emit()
                                 self.is_threat_active = False
                                 self.incident_start_time = None
                                 self.max_threat_confidence = 0.0
                     else:
                         # --- SHIELD MODE: v1 full-screen blackout ---
+                        # Emit raw frame for dashboard preview (censorship mode previews the censored feed instead)
+                        self._emit_preview(self.frame_ready, frame)
                         detected, confidence = self.engine.detect(frame)
                         self._evaluate_state(detected, confidence)
                         raw_frame = frame
@@ -250,21 +274,28 @@ class SecurityController(QThread):
                             raw_frame = blocked
             else:
                 # Still emit raw frame for dashboard when paused, but mark it
-                if raw_frame is not None:
+                if raw_frame is not None and self._preview_due and self.preview_enabled:
                     # Add a small "PAUSED" text to the preview so the user knows
                     preview_frame = raw_frame.copy()
                     cv2.putText(preview_frame, "AI PAUSED", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 2)
-                    self.frame_ready.emit(preview_frame)
+                    self._emit_preview(self.frame_ready, preview_frame)
             
             # Broadcast frame to virtual camera (BGR → RGB)
             if vcam is not None and raw_frame is not None:
                 try:
-                    rgb_frame = cv2.cvtColor(raw_frame, cv2.COLOR_BGR2RGB)
-                    # Resize to match virtual camera dimensions if needed
-                    h, w = rgb_frame.shape[:2]
+                    if self._vcam_rgb is None:
+                        self._vcam_rgb = np.empty((vcam.height, vcam.width, 3), dtype=np.uint8)
+                        self._vcam_bgr = np.empty_like(self._vcam_rgb)
+                    # Resize to match virtual camera dimensions if needed (before the swap,
+                    # so the channel swap only ever touches broadcast-sized pixels)
+                    h, w = raw_frame.shape[:2]
+                    bgr_frame = raw_frame
                     if w != vcam.width or h != vcam.height:
-                        rgb_frame = cv2.resize(rgb_frame, (vcam.width, vcam.height))
-                    vcam.send(rgb_frame)
+                        bgr_frame = cv2.resize(raw_frame, (vcam.width, vcam.height), dst=self._vcam_bgr)
+                    # pyvirtualcam needs a contiguous buffer, so a [:, :, ::-1] view would just
+                    # move the copy elsewhere; swap straight into the reused buffer instead
+                    cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB, dst=self._vcam_rgb)
+                    vcam.send(self._vcam_rgb)
                     vcam.sleep_until_next_frame()
                 except Exception as e:
                     pass  # Silently skip frame on transient errors
@@ -277,6 +308,53 @@ class SecurityController(QThread):
             vcam.close()
             print("Virtual Camera closed.")
 
+    def _emit_preview(self, signal, frame):
+        """
+        Builds the privacy-blurred preview here on the worker and sends it to the
+        GUI thread as a QImage, capped at the preview rate.
+        """
+        if not self._preview_due or not self.preview_enabled:
+            return
+        self._last_preview_emit = time.monotonic()
+        signal.emit(self._build_preview(frame))
+
+    def _build_preview(self, frame):
+        """Downscales then blurs a BGR frame into a preview-sized QImage."""
+        # Preview geometry and buffers only change with the camera resolution
+        frame_hw = frame.shape[:2]
+        if self._preview_meta is None or self._preview_meta[0] != frame_hw:
+            frame_h, frame_w = frame_hw
+            scale = min(self._preview_size[0] / frame_w, self._preview_size[1] / frame_h)
+            w, h = max(1, int(frame_w * scale)), max(1, int(frame_h * scale))
+            self._preview_small = np.empty((h, w, 3), dtype=np.uint8)
+            self._preview_blur = np.empty_like(self._preview_small)
+            self._preview_meta = (frame_hw, w, h, 3 * w)
+        _, w, h, bytes_per_line = self._preview_meta
+        
+        cv2.resize(frame, (w, h), dst=self._preview_small, interpolation=cv2.INTER_AREA)
+        # A box filter smears as well as a Gaussian for a privacy thumbnail, on OpenCV's cheaper
+        # running-sum path (its sigma is ~2.6 px vs ~1.7 px for the 9x9 Gaussian it replaces)
+        blurred = cv2.boxFilter(self._preview_small, -1, (9, 9), dst=self._preview_blur, normalize=True)
+        # .copy() detaches the image from the numpy buffer so it can safely cross threads
+        return QImage(blurred.data, w, h, bytes_per_line, QImage.Format.Format_BGR888).copy()
+
+    def set_preview_enabled(self, enabled: bool):
+        self.preview_enabled = enabled
+
+    def _fit_debug_frame(self, frame):
+        """Resizes the annotated frame to fit the Debug View so the GUI thread never scales it."""
+        if self._debug_target is None:
+            return frame
+        frame_h, frame_w = frame.shape[:2]
+        scale = min(self._debug_target[0] / frame_w, self._debug_target[1] / frame_h)
+        w, h = max(1, int(frame_w * scale)), max(1, int(frame_h * scale))
+        if (w, h) == (frame_w, frame_h):
+            return frame
+        return cv2.resize(frame, (w, h), interpolation=cv2.INTER_LINEAR)
+
+    def set_debug_target(self, width: int, height: int):
+        self._debug_target = (width, height)
+
     def _evaluate_state(self, detected, confidence):
         """Applies heuristic validation (confidence thresholds & persistence)."""
         threshold, required_persistence, log_enabled, lockout_duration = self.get_settings()
@@ -294,6 +372,8 @@ class SecurityController(QThread):
             # If a threat is seen while the lockout timer is active, reset the timer
             if self.is_threat_active:
                 self.lockout_end_time = current_time + lockout_duration
+                # The shield counts down and unlocks on its own; just move its deadline with ours
+                self.threat_detected.emit(True, float(lockout_duration))
                 
         else:
             # Quick decay: if phone disappears, drop threat frames rapidly.
@@ -306,7 +386,7 @@ class SecurityController(QThread):
                 self.is_threat_active = True
                 self.incident_start_time = current_time
                 self.lockout_end_time = current_time + lockout_duration
-                self.threat_detected.emit(True, int(self.lockout_end_time - current_time))
+                self.threat_detected.emit(True, float(lockout_duration))
                 print(f"THREAT ENTERED: Score {self.max_threat_confidence:.2f}")
                 
         elif self.consecutive_threat_frames == 0 and self.is_threat_active:
@@ -318,6 +398,7 @@ class SecurityController(QThread):
                 
                 if log_enabled:
                     self.logger.log_threat("Cell phone visual intrusion", self.max_threat_confidence, duration)
+                    self.incident_logged.emit()
                     print(f"THREAT EXITED: Duration {duration:.2f}s logged.")
                 else:
                     print("THREAT EXITED: Logging disabled by user.")
@@ -326,14 +407,7 @@ class SecurityController(QThread):
                 self.incident_start_time = None
                 self.max_threat_confidence = 0.0
                 self.lockout_end_time = 0.0
-                self.threat_detected.emit(False, 0)
-        
-        # Continuous signal emission to update the UI countdown timer while locked out
-        if self.is_threat_active:
-            remaining = int(self.lockout_end_time - current_time)
-            # Prevent negative numbers from short timing glitches
-            remaining = max(0, remaining)
-            self.threat_detected.emit(True, remaining)
+                self.threat_detected.emit(False, 0.0)
 
     def _resolve_threat_cleanly(self):
         """Immediately dissolves any active threat state and clears the timers."""
@@ -343,7 +417,7 @@ class SecurityController(QThread):
             self.incident_start_time = None
             self.max_threat_confidence = 0.0
             self.lockout_end_time = 0.0
-            self.threat_detected.emit(False, 0)
+            self.threat_detected.emit(False, 0.0)
             
     def set_debug_mode(self, enabled: bool):
         self.debug_mode = enabled
@@ -375,18 +449,83 @@ class SecurityController(QThread):
         self._last_censored_frame = None
         print(f"Protection mode changed to: {mode.value}")
 
+    def _match_threats(self, boxes):
+        """
+        Matches this frame's (N, 4) int32 boxes against the threat memory, updating
+        matched threats in place and registering new ones. Returns the set of touched IDs.
+        """
+        track_ids = list(self._active_threats.keys())
+        tracks = np.array([self._active_threats[tid]["box"] for tid in track_ids],
+                          dtype=np.float64).reshape(-1, 4)
+        if JIT_AVAILABLE:
+            # Compiled path: one native call resolves every detection's slot
+            slots = match_tracks(boxes, tracks, self._iou_match_threshold)
+        else:
+            slots = self._match_slots(boxes, tracks)
+
+        matched_ids = set()
+        for box, slot in zip(boxes, slots):
+            if slot < len(track_ids):
+                # Update existing threat
+                tid = track_ids[slot]
+                self._active_threats[tid]["box"] = box
+                self._active_threats[tid]["cooldown"] = 0
+            else:
+                # New threat (slots past the existing tracks are allocated in order)
+                tid = self._next_threat_id
+                self._active_threats[tid] = {"box": box, "cooldown": 0}
+                track_ids.append(tid)
+                self._next_threat_id += 1
+            matched_ids.add(tid)
+        return matched_ids
+
+    def _match_slots(self, boxes, tracks):
+        """NumPy fallback for match_tracks: same greedy slot assignment, one IoU row per box."""
+        slots = []
+        for box in boxes:
+            best_slot = -1
+            if len(tracks):
+                ious = self._compute_iou(box, tracks)
+                slot = int(np.argmax(ious))
+                if ious[slot] > self._iou_match_threshold:
+                    best_slot = slot
+
+            if best_slot >= 0:
+                tracks[best_slot] = box
+            else:
+                best_slot = len(tracks)
+                tracks = np.vstack([tracks, box.astype(np.float64)])
+            slots.append(best_slot)
+        return slots
+
+    def _padded_rois(self, frame_w, frame_h):
+        """Returns every active threat box expanded by the ROI padding and clamped to the frame."""
+        boxes = np.array([tdata["box"] for tdata in self._active_threats.values()],
+                         dtype=np.int32).reshape(-1, 4)
+        pads = ((boxes[:, 2:] - boxes[:, :2]) * self._roi_padding).astype(np.int32)
+        rois = np.empty_like(boxes)
+        rois[:, :2] = boxes[:, :2] - pads
+        rois[:, 2:] = boxes[:, 2:] + pads
+        np.clip(rois, 0, np.array([frame_w, frame_h, frame_w, frame_h], dtype=np.int32), out=rois)
+        return rois
+
     @staticmethod
     def _compute_iou(box_a, box_b):
-        """Compute Intersection over Union between two (x1,y1,x2,y2) boxes."""
-        xa = max(box_a[0], box_b[0])
-        ya = max(box_a[1], box_b[1])
-        xb = min(box_a[2], box_b[2])
-        yb = min(box_a[3], box_b[3])
-        inter = max(0, xb - xa) * max(0, yb - ya)
-        area_a = (box_a[2] - box_a[0]) * (box_a[3] - box_a[1])
-        area_b = (box_b[2] - box_b[0]) * (box_b[3] - box_b[1])
+        """
+        Compute Intersection over Union between (x1,y1,x2,y2) boxes.
+        Either argument may also be an (M, 4) stack, giving M results at once.
+        """
+        box_a = np.asarray(box_a, dtype=np.float64)
+        box_b = np.asarray(box_b, dtype=np.float64)
+        xa = np.maximum(box_a[..., 0], box_b[..., 0])
+        ya = np.maximum(box_a[..., 1], box_b[..., 1])
+        xb = np.minimum(box_a[..., 2], box_b[..., 2])
+        yb = np.minimum(box_a[..., 3], box_b[..., 3])
+        inter = np.maximum(0.0, xb - xa) * np.maximum(0.0, yb - ya)
+        area_a = (box_a[..., 2] - box_a[..., 0]) * (box_a[..., 3] - box_a[..., 1])
+        area_b = (box_b[..., 2] - box_b[..., 0]) * (box_b[..., 3] - box_b[..., 1])
         union = area_a + area_b - inter
-        return inter / union if union > 0 else 0.0
+        return np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
 
     def request_camera_restart(self):
         self.pending_camera_restart = True
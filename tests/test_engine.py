@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("cv2")
+
+from core.engine import YoloV8Engine
+
+TARGET = 67
+
+
+def _engine():
+    # Box conversion needs no ONNX session, only the target class
+    engine = YoloV8Engine.__new__(YoloV8Engine)
+    engine.target_class_id = TARGET
+    return engine
+
+
+def _outputs(anchors):
+    """Builds a [1, 84, N] float32 output from (x_c, y_c, w, h, phone_score) anchors."""
+    preds = np.zeros((1, 84, len(anchors)), dtype=np.float32)
+    for i, (x_c, y_c, w, h, score) in enumerate(anchors):
+        preds[0, :4, i] = (x_c, y_c, w, h)
+        preds[0, 4 + TARGET, i] = score
+    return [preds]
+
+
+def _reference(outputs, orig_shape, ratio, pad, conf_threshold):
+    """The original per-anchor Python loop."""
+    predictions = np.transpose(outputs[0], (0, 2, 1))[0]
+    orig_h, orig_w = orig_shape[:2]
+    pad_w, pad_h = pad
+    best_conf = 0.0
+    detected = False
+    threat_boxes = []
+    for pred in predictions:
+        x_c, y_c, bw, bh = pred[0], pred[1], pred[2], pred[3]
+        score = float(pred[4:][TARGET])
+        if score < conf_threshold:
+            continue
+        detected = True
+        best_conf = max(best_conf, score)
+        x1 = max(0, int((x_c - bw / 2 - pad_w) / ratio))
+        y1 = max(0, int((y_c - bh / 2 - pad_h) / ratio))
+        x2 = min(orig_w, int((x_c + bw / 2 - pad_w) / ratio))
+        y2 = min(orig_h, int((y_c + bh / 2 - pad_h) / ratio))
+        threat_boxes.append((x1, y1, x2, y2))
+    return detected, best_conf, threat_boxes
+
+
+def test_boxes_match_reference_loop():
+    # 1280x720 letterboxed into 640x640: ratio 0.5, 140px vertical padding
+    orig_shape = (720, 1280, 3)
+    ratio, pad = 0.5, (0.0, 140.0)
+    outputs = _outputs([
+        (320.0, 320.0, 100.0, 60.0, 0.9),    # centred
+        (10.0, 150.0, 40.0, 40.0, 0.6),      # spills past the left/top edges
+        (635.0, 495.0, 30.0, 30.0, 0.4),     # spills past the right/bottom edges
+        (200.5, 333.3, 17.7, 9.9, 0.3),      # fractional coords truncate
+        (100.0, 300.0, 50.0, 50.0, 0.1),     # below threshold
+    ])
+
+    detected, best, boxes = _engine()._postprocess_boxes(outputs, orig_shape, ratio, pad, 0.25)
+    ref_detected, ref_best, ref_boxes = _reference(outputs, orig_shape, ratio, pad, 0.25)
+
+    assert detected == ref_detected is True
+    assert best == pytest.approx(ref_best)
+    assert boxes.dtype == np.int32
+    assert boxes.shape == (4, 4)
+    assert boxes.tolist() == [list(b) for b in ref_boxes]
+
+
+def test_boxes_are_clamped_to_frame():
+    orig_shape = (720, 1280, 3)
+    outputs = _outputs([(0.0, 140.0, 100.0, 100.0, 0.9), (640.0, 500.0, 100.0, 100.0, 0.9)])
+
+    _, _, boxes = _engine()._postprocess_boxes(outputs, orig_shape, 0.5, (0.0, 140.0), 0.25)
+
+    assert boxes[:, :2].min() >= 0
+    assert (boxes[:, 2] <= 1280).all()
+    assert (boxes[:, 3] <= 720).all()
+
+
+def test_no_detections_returns_empty_int32_array():
+    outputs = _outputs([(320.0, 320.0, 100.0, 60.0, 0.1)])
+
+    detected, best, boxes = _engine()._postprocess_boxes(outputs, (720, 1280, 3), 0.5, (0.0, 140.0), 0.25)
+
+    assert detected is False
+    assert best == 0.0
+    assert boxes.dtype == np.int32
+    assert boxes.shape == (0, 4)
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from security._jit import match_tracks
+
+IOU_THRESH = 0.3
+
+
+def _iou(box_a, box_b):
+    """The original scalar IoU."""
+    xa = max(box_a[0], box_b[0])
+    ya = max(box_a[1], box_b[1])
+    xb = min(box_a[2], box_b[2])
+    yb = min(box_a[3], box_b[3])
+    inter = max(0, xb - xa) * max(0, yb - ya)
+    area_a = (box_a[2] - box_a[0]) * (box_a[3] - box_a[1])
+    area_b = (box_b[2] - box_b[0]) * (box_b[3] - box_b[1])
+    union = area_a + area_b - inter
+    return inter / union if union > 0 else 0.0
+
+
+def _reference_slots(dets, tracks):
+    """The original per-detection dict loop, reporting the slot each detection landed in."""
+    memory = {i: tuple(t) for i, t in enumerate(tracks)}
+    next_id = len(memory)
+    slots = []
+    for box in dets:
+        best_iou = 0.0
+        best_id = None
+        for tid, tbox in memory.items():
+            iou = _iou(box, tbox)
+            if iou > best_iou:
+                best_iou = iou
+                best_id = tid
+        if best_iou > IOU_THRESH and best_id is not None:
+            memory[best_id] = tuple(box)
+            slots.append(best_id)
+        else:
+            memory[next_id] = tuple(box)
+            slots.append(next_id)
+            next_id += 1
+    return slots
+
+
+def _random_cases(n_cases=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(n_cases):
+        n_dets = int(rng.integers(0, 7))
+        n_tracks = int(rng.integers(0, 6))
+        # Small canvas so boxes overlap often, including exact duplicates and zero-area boxes
+        xy = rng.integers(0, 60, size=(n_dets + n_tracks, 2))
+        wh = rng.integers(0, 40, size=(n_dets + n_tracks, 2))
+        boxes = np.hstack([xy, xy + wh]).astype(np.int32)
+        yield boxes[:n_dets], boxes[n_dets:].astype(np.float64)
+
+
+def _assert_matches_reference(match):
+    for dets, tracks in _random_cases():
+        expected = _reference_slots(dets, tracks)
+        assert list(match(dets, tracks.copy())) == expected
+
+
+def test_match_kernel_logic_matches_reference():
+    # The undecorated Python body, so the algorithm is checked even without Numba
+    kernel = getattr(match_tracks, "py_func", match_tracks)
+    _assert_matches_reference(lambda d, t: kernel(d, t, IOU_THRESH))
+
+
+def test_compiled_match_tracks_matches_reference():
+    pytest.importorskip("numba")
+    _assert_matches_reference(lambda d, t: match_tracks(d, t, IOU_THRESH))
+
+
+def test_numpy_fallback_matches_reference():
+    pytest.importorskip("PyQt6")
+    pytest.importorskip("cv2")
+    from security.controller import SecurityController
+
+    controller = SecurityController.__new__(SecurityController)
+    controller._iou_match_threshold = IOU_THRESH
+    _assert_matches_reference(controller._match_slots)
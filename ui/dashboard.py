@@ -3,11 +3,78 @@ from PyQt6.QtWidgets import (
     QSlider, QCheckBox, QPushButton, QFrame, 
     QApplication, QStyle, QMessageBox, QComboBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QImage, QPixmap, QIcon
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QObject, QThread, QTimer
+from PyQt6.QtGui import QPixmap, QIcon
 from PyQt6.QtMultimedia import QMediaDevices
 import cv2
+import json
 import os
+import time
+
+CAMERA_CACHE_FILENAME = "camera_cache.json"
+CAMERA_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# ONNX listing of the models directory, keyed on the directory's mtime
+_MODEL_CACHE = {'mtime': None, 'files': []}
+
+
+def _list_onnx_models(model_dir):
+    """Returns the sorted .onnx files in model_dir, re-reading it only when its mtime changes."""
+    try:
+        mtime = os.stat(model_dir).st_mtime_ns
+    except OSError:
+        return []
+    if mtime != _MODEL_CACHE['mtime']:
+        _MODEL_CACHE['files'] = sorted(f for f in os.listdir(model_dir) if f.endswith(".onnx"))
+        _MODEL_CACHE['mtime'] = mtime
+    return _MODEL_CACHE['files']
+
+
+def list_qt_cameras():
+    """
+    Lists QtMultimedia's video inputs as (name, index) tuples (good for real names of physical devices).
+    Cheap, and QtMultimedia isn't documented as thread-safe, so call it on the UI thread.
+    """
+    found = []
+    for i, cam in enumerate(QMediaDevices.videoInputs()):
+        desc = cam.description()
+        found.append((desc if desc else f"Camera {i}", i))
+    return found
+
+
+def probe_cameras(qt_cameras, is_deep=False):
+    """
+    Completes the QtMultimedia listing into the full list of (name, index) tuples.
+    Slow: opening DirectShow devices can take hundreds of ms each, keep it off the UI thread.
+    The DirectShow sweep only runs when QtMultimedia found nothing or is_deep is set.
+    """
+    found = list(qt_cameras)
+    qt_found = len(qt_cameras)
+
+    # Fallback / Augment with OpenCV DirectShow (catches OBS Virtual Camera better on Windows)
+    # We'll check up to index 4. Only on a deep scan when Qt already found devices, since it's
+    # almost always redundant then and each open can block for hundreds of ms.
+    if qt_found == 0 or is_deep:
+        for i in range(qt_found, 5):
+            cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)
+            if cap.isOpened():
+                found.append((f"DShow Camera {i}", i))
+                cap.release()
+
+    return found
+
+
+class CameraProber(QObject):
+    """
+    Worker that runs the DirectShow sweep on its own QThread.
+    Results cross back to the UI thread through a queued signal.
+    """
+    discovered = pyqtSignal(object)  # list of (name, index) tuples
+
+    @pyqtSlot(object, bool)
+    def probe(self, qt_cameras, is_deep):
+        self.discovered.emit(probe_cameras(qt_cameras, is_deep))
+
 
 class SettingsDashboard(QWidget):
     """
@@ -18,49 +85,108 @@ class SettingsDashboard(QWidget):
     restart_engine_requested = pyqtSignal()
     mode_changed = pyqtSignal(str)  # Emits "shield" or "censorship"
     debug_view_requested = pyqtSignal(bool)
+    visibility_changed = pyqtSignal(bool)
+    _probe_requested = pyqtSignal(object, bool)  # Qt camera list, is_deep
+
+    # Shared across instances so re-opening the dashboard doesn't rebuild them
+    _STYLESHEET = """
+        QWidget {
+            background-color: #1e1e1e;
+            color: #ffffff;
+            font-family: 'Segoe UI', Arial, sans-serif;
+        }
+        QLabel {
+            font-size: 14px;
+        }
+        QSlider::handle:horizontal {
+            background: #4caf50;
+            width: 14px;
+            margin: -4px 0;
+            border-radius: 7px;
+        }
+        QSlider::groove:horizontal {
+            border: 1px solid #999999;
+            height: 6px;
+            background: #555555;
+            margin: 0px 0;
+        }
+        QCheckBox::indicator {
+            width: 16px;
+            height: 16px;
+        }
+        QCheckBox::indicator:checked {
+            background-color: #4caf50;
+            border: 1px solid #4caf50;
+        }
+        QFrame#separator {
+            background-color: #333333;
+        }
+        QPushButton#refresh_cam_btn {
+            background-color: #333333;
+            padding: 4px;
+            border-radius: 4px;
+        }
+        QPushButton#logs_btn {
+            background-color: #333333;
+            padding: 8px;
+            border-radius: 4px;
+        }
+        QPushButton#debug_btn {
+            background-color: #555555;
+            padding: 8px;
+            border-radius: 4px;
+            font-weight: bold;
+        }
+        QPushButton#debug_btn:checked {
+            background-color: #bfa100;
+            color: black;
+        }
+    """
+    _SHIELD_PIXMAP = None  # Rendered lazily, needs a QApplication
 
     def __init__(self, config_handler, logger_instance):
         super().__init__()
         self.config = config_handler
         self.logger = logger_instance
+        self._listed_cameras = None
+        self._log_cache = None
+        self._log_cache_ts = 0.0
+
+        # Slider drags fire on every step; coalesce them into one config write
+        self._pending_cfg = {}
+        self._cfg_timer = QTimer(self)
+        self._cfg_timer.setSingleShot(True)
+        self._cfg_timer.setInterval(300)
+        self._cfg_timer.timeout.connect(self._flush_cfg)
+        QApplication.instance().aboutToQuit.connect(self._flush_cfg)
+
+        # Camera probing opens DirectShow devices, so it runs on its own thread
+        self._probe_thread = QThread(self)
+        self._prober = CameraProber()
+        self._prober.moveToThread(self._probe_thread)
+        self._prober.discovered.connect(self._on_cameras_discovered)
+        self._probe_requested.connect(self._prober.probe)
+        self._probe_thread.finished.connect(self._prober.deleteLater)
+        QApplication.instance().aboutToQuit.connect(self._stop_probe_thread)
+        self._probe_thread.start()
+
+        self._last_draw_ns = 0
+        # ~15 FPS is plenty for a preview. The controller already paces at 15 FPS, so
+        # leave a little slack for signal-queue jitter instead of dropping every other frame.
+        self._min_interval_ns = int(1e9 / 16)
         self.init_ui()
 
     def init_ui(self):
         self.setWindowTitle("LensBlock - Security Dashboard")
         self.setMinimumSize(500, 480)
         self.resize(500, 520)
+
+        # Read every setting the widgets start from in one pass
+        snap = self.config.snapshot()
+        detection_cfg = snap.get('detection', {})
         
         # Dark theme styling
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-            QLabel {
-                font-size: 14px;
-            }
-            QSlider::handle:horizontal {
-                background: #4caf50;
-                width: 14px;
-                margin: -4px 0;
-                border-radius: 7px;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #999999;
-                height: 6px;
-                background: #555555;
-                margin: 0px 0;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #4caf50;
-                border: 1px solid #4caf50;
-            }
-        """)
+        self.setStyleSheet(SettingsDashboard._STYLESHEET)
 
         layout = QVBoxLayout()
         self.setLayout(layout)
@@ -71,9 +197,10 @@ class SettingsDashboard(QWidget):
         self.status_label = QLabel("System Status: ARMED")
         self.status_label.setStyleSheet("color: #4caf50; font-weight: bold; font-size: 16px;")
         
-        self.shield_icon = QIcon('media/LensBlockBGRem.png')
+        if SettingsDashboard._SHIELD_PIXMAP is None:
+            SettingsDashboard._SHIELD_PIXMAP = QIcon('media/LensBlockBGRem.png').pixmap(80, 80)
         self.icon_label = QLabel()
-        self.icon_label.setPixmap(self.shield_icon.pixmap(80, 80))
+        self.icon_label.setPixmap(SettingsDashboard._SHIELD_PIXMAP)
 
         header_layout.addWidget(self.icon_label)
         header_layout.addWidget(self.status_label)
@@ -92,8 +219,8 @@ class SettingsDashboard(QWidget):
         self.camera_combo.currentIndexChanged.connect(self._camera_changed)
         
         self.refresh_cam_btn = QPushButton("Refresh")
-        self.refresh_cam_btn.setStyleSheet("background-color: #333333; padding: 4px; border-radius: 4px;")
-        self.refresh_cam_btn.clicked.connect(self._populate_cameras)
+        self.refresh_cam_btn.setObjectName("refresh_cam_btn")
+        self.refresh_cam_btn.clicked.connect(self._refresh_cameras)
         
         self._populate_cameras() # Initial population
         
@@ -104,13 +231,11 @@ class SettingsDashboard(QWidget):
         # Model Dropdown
         self.model_combo = QComboBox()
         model_dir = "models"
-        if os.path.exists(model_dir):
-            onnx_models = [f for f in os.listdir(model_dir) if f.endswith(".onnx")]
-            for model_file in onnx_models:
-                # Add human readable text and proper relative path as data
-                self.model_combo.addItem(model_file, f"{model_dir}/{model_file}")
+        for model_file in _list_onnx_models(model_dir):
+            # Add human readable text and proper relative path as data
+            self.model_combo.addItem(model_file, f"{model_dir}/{model_file}")
                 
-        curr_model = self.config.get('detection', 'model_path', 'models/yolov8n.onnx')
+        curr_model = detection_cfg.get('model_path', 'models/yolov8n.onnx')
         idx_found = self.model_combo.findData(curr_model)
         if idx_found >= 0:
             self.model_combo.setCurrentIndex(idx_found)
@@ -131,7 +256,7 @@ class SettingsDashboard(QWidget):
         self.sens_slider = QSlider(Qt.Orientation.Horizontal)
         self.sens_slider.setRange(50, 90)
         # Load setting (0.60 -> 60)
-        curr_sens = int(self.config.get('detection', 'confidence_threshold', 0.60) * 100)
+        curr_sens = int(detection_cfg.get('confidence_threshold', 0.60) * 100)
         self.sens_slider.setValue(curr_sens)
         
         self.sens_value_label = QLabel(f"{curr_sens}%")
@@ -149,7 +274,7 @@ class SettingsDashboard(QWidget):
         self.pers_slider = QSlider(Qt.Orientation.Horizontal)
         self.pers_slider.setRange(1, 5)
         # Load setting
-        curr_pers = self.config.get('detection', 'persistence_frames', 3)
+        curr_pers = detection_cfg.get('persistence_frames', 3)
         self.pers_slider.setValue(curr_pers)
         
         self.pers_value_label = QLabel(f"{curr_pers} frames")
@@ -178,25 +303,25 @@ class SettingsDashboard(QWidget):
 
         # 3. Switches and Logs
         self.log_checkbox = QCheckBox("Enable Forensic SQLite Logging")
-        self.log_checkbox.setChecked(self.config.get('logging', 'enable_forensic_logging', True))
+        self.log_checkbox.setChecked(snap.get('logging', {}).get('enable_forensic_logging', True))
         self.log_checkbox.stateChanged.connect(self._log_toggled)
         layout.addWidget(self.log_checkbox)
 
         self.boot_checkbox = QCheckBox("Start on Boot (Windows)")
-        self.boot_checkbox.setChecked(self.config.get('system', 'start_on_boot', False))
+        self.boot_checkbox.setChecked(snap.get('system', {}).get('start_on_boot', False))
         self.boot_checkbox.stateChanged.connect(self._boot_toggled)
         layout.addWidget(self.boot_checkbox)
 
         # View Logs Button
         self.logs_btn = QPushButton("View Recent Logs")
-        self.logs_btn.setStyleSheet("background-color: #333333; padding: 8px; border-radius: 4px;")
+        self.logs_btn.setObjectName("logs_btn")
         self.logs_btn.clicked.connect(self._show_logs)
         layout.addWidget(self.logs_btn)
         
         # Debug View Button
         self.debug_btn = QPushButton("🛠️ Enable Debug View")
         self.debug_btn.setCheckable(True)
-        self.debug_btn.setStyleSheet("background-color: #555555; padding: 8px; border-radius: 4px; font-weight: bold;")
+        self.debug_btn.setObjectName("debug_btn")
         self.debug_btn.toggled.connect(self._debug_toggled)
         layout.addWidget(self.debug_btn)
         
@@ -225,30 +350,50 @@ class SettingsDashboard(QWidget):
         
         layout.addLayout(preview_layout)
 
-    def _populate_cameras(self):
-        """Discovers and populates the camera dropdown."""
+    def _populate_cameras(self, is_deep=False):
+        """
+        Fills the camera dropdown from the on-disk cache immediately (or a placeholder
+        if it is missing or stale), then always re-probes in the background.
+        """
+        cameras, is_fresh = self._load_camera_cache()
+        if is_fresh:
+            self._fill_camera_combo(cameras)
+        else:
+            # The probe below always replaces the placeholder
+            self._listed_cameras = None
+            self.camera_combo.blockSignals(True)
+            self.camera_combo.clear()
+            self.camera_combo.addItem("Scanning...", None)
+            self.camera_combo.blockSignals(False)
+        
+        self._probe_requested.emit(list_qt_cameras(), is_deep)
+
+    def _refresh_cameras(self):
+        """Explicit user refresh: deep re-probe (including DirectShow) on the worker thread."""
+        self._populate_cameras(is_deep=True)
+
+    def _stop_probe_thread(self):
+        # No timeout: a deep DirectShow probe can block for a while, and destroying
+        # a QThread that is still running aborts the process on exit
+        self._probe_thread.quit()
+        self._probe_thread.wait()
+
+    def _on_cameras_discovered(self, cameras):
+        """Persists a fresh enumeration and updates the dropdown if anything changed."""
+        self._save_camera_cache(cameras)
+        if cameras != self._listed_cameras:
+            self._fill_camera_combo(cameras)
+
+    def _fill_camera_combo(self, cameras):
+        """Rebuilds the camera dropdown from a list of (name, index) tuples."""
+        self._listed_cameras = cameras
         self.camera_combo.blockSignals(True)
         self.camera_combo.clear()
         
-        # 1. Try QtMultimedia first (good for real names of physical devices)
-        cameras = QMediaDevices.videoInputs()
-        qt_found = len(cameras)
-        
-        if cameras:
-            for i, cam in enumerate(cameras):
-                desc = cam.description()
-                name = desc if desc else f"Camera {i}"
-                self.camera_combo.addItem(name, i)
-                
-        # 2. Fallback / Augment with OpenCV DirectShow (catches OBS Virtual Camera better on Windows)
-        # We'll check up to index 4. If Qt found it, we might double-list, but it ensures virtual cams appear.
-        for i in range(qt_found, 5): 
-            cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)
-            if cap.isOpened():
-                self.camera_combo.addItem(f"DShow Camera {i}", i)
-                cap.release()
+        for name, index in cameras:
+            self.camera_combo.addItem(name, index)
                 
-        # 3. Absolute Fallback if nothing at all
+        # Absolute Fallback if nothing at all
         if self.camera_combo.count() == 0:
             for i in range(5):
                 self.camera_combo.addItem(f"Unknown Camera {i}", i)
@@ -260,15 +405,59 @@ class SettingsDashboard(QWidget):
             
         self.camera_combo.blockSignals(False)
 
+    def _camera_cache_path(self):
+        return os.path.join(os.path.dirname(self.config.config_path), CAMERA_CACHE_FILENAME)
+
+    def _load_camera_cache(self):
+        """
+        Returns (cameras, is_fresh) from the cache file, or ([], False) if unusable.
+        An empty camera list is never fresh, so it shows the placeholder until the probe finishes.
+        """
+        try:
+            with open(self._camera_cache_path(), 'r') as f:
+                data = json.load(f)
+            cameras = [(str(name), int(index)) for name, index in data['cameras']]
+            is_fresh = bool(cameras) and (time.time() - float(data['timestamp'])) < CAMERA_CACHE_TTL_SECONDS
+            return cameras, is_fresh
+        except (OSError, ValueError, KeyError, TypeError):
+            return [], False
+
+    def _save_camera_cache(self, cameras):
+        try:
+            with open(self._camera_cache_path(), 'w') as f:
+                json.dump({'timestamp': time.time(), 'cameras': cameras}, f)
+        except OSError as e:
+            print(f"Error saving camera cache: {e}")
+
     def _camera_changed(self, index):
         cam_idx = self.camera_combo.itemData(index)
-        self.config.set('system', 'camera_index', cam_idx)
-        self.restart_camera_requested.emit()
+        if cam_idx is None:
+            return  # "Scanning..." placeholder
+        self._queue_cfg('system', 'camera_index', cam_idx)
         
     def _model_changed(self, index):
         model_path = self.model_combo.itemData(index)
-        self.config.set('detection', 'model_path', model_path)
-        self.restart_engine_requested.emit()
+        self._queue_cfg('detection', 'model_path', model_path)
+
+    def _queue_cfg(self, section, key, value):
+        """Stages a config change; the debounce timer writes it once input settles."""
+        self._pending_cfg[(section, key)] = value
+        self._cfg_timer.start()
+
+    def _flush_cfg(self):
+        """Writes all staged config changes in a single save, then applies restarts."""
+        pending, self._pending_cfg = self._pending_cfg, {}
+        if not pending:
+            return
+        for (section, key), value in pending.items():
+            self.config.set(section, key, value, save=False)
+        self.config.save_config()
+        
+        # Restarts read the config, so they only fire once it's written
+        if ('system', 'camera_index') in pending:
+            self.restart_camera_requested.emit()
+        if ('detection', 'model_path') in pending:
+            self.restart_engine_requested.emit()
 
     def _toggle_mode(self):
         if self._current_mode == "shield":
@@ -291,17 +480,17 @@ class SettingsDashboard(QWidget):
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
         line.setFrameShadow(QFrame.Shadow.Sunken)
-        line.setStyleSheet("background-color: #333333;")
+        line.setObjectName("separator")
         layout.addWidget(line)
 
     def _sens_changed(self, value):
         self.sens_value_label.setText(f"{value}%")
         # Save dynamically 
-        self.config.set('detection', 'confidence_threshold', value / 100.0)
+        self._queue_cfg('detection', 'confidence_threshold', value / 100.0)
 
     def _pers_changed(self, value):
         self.pers_value_label.setText(f"{value} frames")
-        self.config.set('detection', 'persistence_frames', value)
+        self._queue_cfg('detection', 'persistence_frames', value)
         
     def _log_toggled(self, state):
         val = bool(state)
@@ -311,56 +500,65 @@ class SettingsDashboard(QWidget):
         val = bool(state)
         self.config.set('system', 'start_on_boot', val)
         
+    def invalidate_log_cache(self):
+        """Drops the cached logs so the next view reflects a newly logged incident."""
+        self._log_cache = None
+
     def _show_logs(self):
-        logs = self.logger.get_recent_logs(limit=5)
+        # Serve repeated clicks from memory; the controller invalidates on new incidents
+        now = time.monotonic()
+        if self._log_cache is not None and (now - self._log_cache_ts) < 2.0:
+            logs = self._log_cache
+        else:
+            logs = self.logger.get_recent_logs(limit=5)
+            self._log_cache = logs
+            self._log_cache_ts = now
         
         if not logs:
             QMessageBox.information(self, "Recent Logs", "No threats recorded in the database.")
             return
             
-        msg = "Recent Security Violations:\n\n"
+        parts = ["Recent Security Violations:", ""]
         for log in logs:
             # ID | Time | Type | Conf | Duration
             # e.g., [1745] Cell phone (87%): 2.5s
-            ts = log[1].split('T')[1][:8] # Extract just time from ISO format
+            ts = log[1].split('T', 1)[1][:8] # Extract just time from ISO format
             conf = int(log[3] * 100)
-            msg += f"[{ts}] {log[2]} ({conf}% confidence) - Duration: {log[4]:.1f}s\n"
+            parts.append(f"[{ts}] {log[2]} ({conf}% confidence) - Duration: {log[4]:.1f}s")
             
-        QMessageBox.information(self, "Recent Logs", msg)
+        QMessageBox.information(self, "Recent Logs", "\n".join(parts))
 
     def _debug_toggled(self, state):
         val = bool(state)
         if val:
             self.debug_btn.setText("🛠️ Disable Debug View")
-            self.debug_btn.setStyleSheet("background-color: #bfa100; color: black; padding: 8px; border-radius: 4px; font-weight: bold;")
         else:
             self.debug_btn.setText("🛠️ Enable Debug View")
-            self.debug_btn.setStyleSheet("background-color: #555555; padding: 8px; border-radius: 4px; font-weight: bold;")
         self.debug_view_requested.emit(val)
 
-    def update_frame(self, cv_frame):
-        """Called by the main thread via signal from the controller."""
-        # Optional: apply blur based on UX spec
-        blurred = cv2.GaussianBlur(cv_frame, (51, 51), 0)
-        
-        # Convert OpenCV BGR format to Qt Format
-        rgb_image = cv2.cvtColor(blurred, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        bytes_per_line = ch * w
-        
-        # Create QImage from buffer
-        # Keep reference to the Python wrapper alive
-        self.__last_frame = rgb_image 
-        q_img = QImage(self.__last_frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        
-        # Scale down for preview
-        pixmap = QPixmap.fromImage(q_img).scaled(
-            self.preview_window.size(), 
-            Qt.AspectRatioMode.KeepAspectRatio, 
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.preview_window.setPixmap(pixmap)
+    def update_frame(self, q_img):
+        """Called by the main thread with the controller's preview QImage."""
+        # Nothing to draw into while hidden/minimized (the dashboard usually lives in the tray)
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
+
+        # Drop frames arriving faster than the preview rate
+        now = time.monotonic_ns()
+        if now - self._last_draw_ns < self._min_interval_ns:
+            return
+        self._last_draw_ns = now
+
+        # The controller already sized it to fit 320x180 and blurred it, so no rescale here
+        self.preview_window.setPixmap(QPixmap.fromImage(q_img))
         
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.visibility_changed.emit(False)
+
     def closeEvent(self, event):
         """Hide instead of close, we want the system tray to handle exiting."""
         event.ignore()
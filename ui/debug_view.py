@@ -4,9 +4,9 @@ A small always-on-top window showing live YOLO-annotated frames
 with FPS, status, and detection count overlays.
 """
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap, QGuiApplication
-import cv2
+import numpy as np
 
 
 class DebugView(QWidget):
@@ -14,8 +14,11 @@ class DebugView(QWidget):
     A compact, always-on-top debug window positioned in the bottom-right
     corner of the primary screen showing annotated YOLO detection frames.
     """
+    target_size_changed = pyqtSignal(int, int)  # Frame label (width, height) for the controller
+
     def __init__(self):
         super().__init__()
+        self._frame_meta = None  # (h, w, bytes per line) of the last frame
         self._init_ui()
 
     def _init_ui(self):
@@ -49,6 +52,7 @@ class DebugView(QWidget):
             "color: #555555; font-family: 'Consolas';"
         )
         self.frame_label.setText("Waiting for frames...")
+        self.frame_label.setMinimumSize(1, 1)  # Don't let the current pixmap stop the window shrinking
         layout.addWidget(self.frame_label)
 
         # Position in bottom-right corner of primary screen
@@ -63,22 +67,29 @@ class DebugView(QWidget):
             y = geo.y() + geo.height() - self.height() - 10
             self.move(x, y)
 
+    def resizeEvent(self, event):
+        """Publishes the frame label size so the controller delivers frames already sized to it."""
+        super().resizeEvent(event)
+        # Inside the border, so a full-size pixmap never pushes the label (and window) to grow
+        size = self.frame_label.contentsRect().size()
+        self.target_size_changed.emit(size.width(), size.height())
+
     def update_frame(self, cv_frame):
         """
         Receives a BGR OpenCV frame (already annotated with bounding boxes
-        and info overlay by the controller) and renders it.
+        and info overlay, resized to the label and rate-limited by the controller) and renders it.
         """
-        rgb = cv2.cvtColor(cv_frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-        bpl = ch * w
+        # Nothing to draw into while hidden/minimized
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
 
+        # Qt reads OpenCV's BGR byte order directly, so no RGB copy is needed
         # Must keep a reference so the buffer stays alive
-        self._last_frame = rgb
-        q_img = QImage(self._last_frame.data, w, h, bpl, QImage.Format.Format_RGB888)
-
-        pixmap = QPixmap.fromImage(q_img).scaled(
-            self.frame_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        self.frame_label.setPixmap(pixmap)
+        self._last_frame = np.ascontiguousarray(cv_frame)
+        # Frame geometry only changes when the window is resized
+        if self._frame_meta is None or self._frame_meta[:2] != self._last_frame.shape[:2]:
+            h, w, ch = self._last_frame.shape
+            self._frame_meta = (h, w, ch * w)
+        h, w, bpl = self._frame_meta
+        q_img = QImage(self._last_frame.data, w, h, bpl, QImage.Format.Format_BGR888)
+        self.frame_label.setPixmap(QPixmap.fromImage(q_img))
@@ -1,19 +1,51 @@
 import sys
+import math
+import time
 from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QApplication
-from PyQt6.QtCore import Qt, QTimer, QObject
-from PyQt6.QtGui import QColor, QPalette, QFont, QGuiApplication, QPixmap
+from PyQt6.QtCore import (
+    Qt, QObject, QRect, QTimer, QAbstractAnimation, QEasingCurve, QParallelAnimationGroup, QPropertyAnimation
+)
+from PyQt6.QtGui import QColor, QCursor, QPalette, QFont, QGuiApplication, QPainter, QPixmap
+
+# Shared by every monitor's window instead of being rebuilt per instance
+_SHIELD_BG = QColor('#0f172a')
+
+def _style_label(label, color, family, pixel_size, bold=False):
+    """Colours and sizes a label through QPalette/QFont, skipping Qt's stylesheet parser."""
+    palette = label.palette()
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(color))
+    label.setPalette(palette)
+    font = QFont(family)
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    label.setFont(font)
 
 class ShieldWindow(QWidget):
     """
     A full-screen, always-on-top overlay that visually blocks the screen when a threat is detected.
     It uses a heavy translucent dark effect.
     """
+    _ICON_PIXMAP = None  # Shared by every monitor's window, built lazily (needs a QApplication)
+
     def __init__(self, screen_obj):
         super().__init__()
         self.screen_obj = screen_obj
-        self._init_ui()
+        self._heavy_loaded = False
+        self._is_visible = False  # Mapped on screen (including while fading out)
+        self._activated = False   # Took focus since it was last shown
+
+        # Screen geometry rarely changes: keep it as plain ints and only refresh
+        # them (and re-apply) after Qt reports a change
+        g = self.screen_obj.geometry()
+        self._geom_tuple = (g.x(), g.y(), g.width(), g.height())
+        self._applied_geom = self._geom_tuple
+        self._geom_dirty = False
+        self.screen_obj.geometryChanged.connect(self._on_screen_geom_changed)
 
-    def _init_ui(self):
+        self._init_chrome()
+
+    def _init_chrome(self):
+        center = Qt.AlignmentFlag.AlignCenter
         # Remove window borders and frame
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint | 
@@ -22,46 +54,90 @@ class ShieldWindow(QWidget):
             Qt.WindowType.X11BypassWindowManagerHint
         )
         
-        # Set solid slate overlay color
-        self.setStyleSheet("background-color: #0f172a;")
+        # Solid slate overlay, painted directly in paintEvent: the window is fully opaque,
+        # so Qt can skip the background clear and the compositor needs no per-pixel alpha
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        # Showing doesn't activate: PrivacyShield activates just the shield under the cursor
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating, True)
         
         layout = QVBoxLayout()
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.setAlignment(center)
         self.setLayout(layout)
         
-        # Icon
+        # Icon (pixmap is filled in by _init_heavy_content on first show)
         self.icon_label = QLabel()
-        pixmap = QPixmap('media/LensBlockBGRem.png').scaled(
-            128, 128, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-        )
-        self.icon_label.setPixmap(pixmap)
-        self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.icon_label.setAlignment(center)
         layout.addWidget(self.icon_label)
         
         # Header
         self.header_label = QLabel("VISUAL THREAT DETECTED")
-        self.header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.header_label.setStyleSheet("color: #ef4444; font-size: 32px; font-weight: bold; font-family: 'Segoe UI'; background-color: transparent;")
+        self.header_label.setAlignment(center)
+        _style_label(self.header_label, '#ef4444', 'Segoe UI', 32, bold=True)
         layout.addWidget(self.header_label)
         
         # Subtext
         self.subtext_label = QLabel("A recording device has entered the secure monitoring zone. Please remove the device to resume work.")
-        self.subtext_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.subtext_label.setStyleSheet("color: #94a3b8; font-size: 16px; font-family: 'Segoe UI'; background-color: transparent;")
+        self.subtext_label.setAlignment(center)
+        _style_label(self.subtext_label, '#94a3b8', 'Segoe UI', 16)
         layout.addWidget(self.subtext_label)
         
         # Lockout Timer text
         self.lockout_label = QLabel("System locked for 0 seconds.")
-        self.lockout_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lockout_label.setStyleSheet("color: #ffffff; font-size: 24px; font-weight: bold; font-family: 'Consolas'; margin-top: 20px; background-color: transparent;")
+        self.lockout_label.setAlignment(center)
+        _style_label(self.lockout_label, '#ffffff', 'Consolas', 24, bold=True)
+        self.lockout_label.setContentsMargins(0, 20, 0, 0)
         layout.addWidget(self.lockout_label)
         
         # Initialize opacity
-        self.opacity = 0.0
-        self.setWindowOpacity(self.opacity)
+        self.setWindowOpacity(0.0)
         
         # Snap to specific monitor
-        self.setGeometry(self.screen_obj.geometry())
+        self.setGeometry(QRect(*self._geom_tuple))
+
+    def _init_heavy_content(self):
+        """Decodes the logo once the app is idle, so neither startup nor the first lockout waits on it."""
+        if self._heavy_loaded:
+            return
+        self.icon_label.setPixmap(ShieldWindow._icon_pixmap())
+        self._heavy_loaded = True
+
+    def _on_screen_geom_changed(self, rect):
+        self._geom_tuple = (rect.x(), rect.y(), rect.width(), rect.height())
+        self._geom_dirty = True
+        # Mid-lockout changes must apply now, or part of the monitor stays uncovered
+        if self._is_visible:
+            self.sync_geometry()
+
+    def sync_geometry(self):
+        """Re-snaps the window to its monitor, but only if the monitor's geometry changed."""
+        if not self._geom_dirty:
+            return
+        self._geom_dirty = False
+        if self._geom_tuple != self._applied_geom:
+            self.setGeometry(QRect(*self._geom_tuple))
+            self._applied_geom = self._geom_tuple
+
+    @classmethod
+    def _icon_pixmap(cls):
+        """Decodes and scales the logo once; QPixmap is implicitly shared, so all shields reuse it."""
+        if cls._ICON_PIXMAP is None:
+            cls._ICON_PIXMAP = QPixmap('media/LensBlockBGRem.png').scaled(
+                128, 128, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+            )
+        return cls._ICON_PIXMAP
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), _SHIELD_BG)
+        painter.end()
+
+    def enterEvent(self, event):
+        """If the pointer moves to another monitor's shield, hand keyboard focus to it once."""
+        if not self._activated:
+            self.activateWindow()
+            self._activated = True
+        super().enterEvent(event)
 
     def mousePressEvent(self, event):
         """Intercept clicks so user cannot interact with masked content."""
@@ -84,59 +160,125 @@ class PrivacyShield(QObject):
             shield = ShieldWindow(screen)
             self.shields.append(shield)
             
-        self.opacity = 0.0
-        
-        # Create a single persistent timer for fading to prevent memory leaks/orphaned timers
-        self.fade_timer = QTimer(self)
-        self.fade_timer.timeout.connect(self._do_fade)
+        # Fade-out runs in Qt's C++ animation driver: no Python wakeups while it plays
+        self._fade_group = QParallelAnimationGroup(self)
+        for shield in self.shields:
+            anim = QPropertyAnimation(shield, b"windowOpacity")
+            anim.setDuration(200)
+            anim.setStartValue(1.0)
+            anim.setEndValue(0.0)
+            anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+            self._fade_group.addAnimation(anim)
+        self._fade_group.finished.connect(self._on_fade_finished)
+
+        # Warm the logo from the first idle turn of the event loop, not on the lockout path
+        QTimer.singleShot(0, self._load_heavy_content)
 
-    def trigger_shield(self, is_active: bool, remaining_seconds: int = 0):
-        """Called by the main thread when a threat is detected or resolved."""
+        # Last state pushed to the windows, so unchanged ticks can skip the redraw
+        self._last_shown = False
+        self._last_remaining = None
+
+        # The shield runs its own countdown: one label tick per second, one wake-up to unlock
+        self._unlock_deadline = 0.0
+        self._tick_timer = QTimer(self)
+        self._tick_timer.setSingleShot(True)
+        self._tick_timer.timeout.connect(self._on_second)
+        self._unlock_timer = QTimer(self)
+        self._unlock_timer.setSingleShot(True)
+        self._unlock_timer.timeout.connect(lambda: self.trigger_shield(False))
+
+    def lock_for(self, seconds: float):
+        """
+        Shows the shield (if needed) and keeps it up for the given number of seconds.
+        Calling it again while locked moves the unlock deadline.
+        """
+        self._unlock_deadline = time.monotonic() + seconds
+        # Round up so the shield never lifts before the controller's own deadline
+        self._unlock_timer.start(math.ceil(seconds * 1000))
+        self._on_second()
+        self.trigger_shield(True)
+
+    def _on_second(self):
+        left = self._unlock_deadline - time.monotonic()
+        remaining = max(0, math.ceil(left))
+        # Format once for all screens, and only when the displayed second changes
+        if remaining != self._last_remaining:
+            text = f"System locked for {remaining} seconds."
+            for shield in self.shields:
+                shield.lockout_label.setText(text)
+            self._last_remaining = remaining
+        # Wake exactly when the displayed second next changes (at most once a second)
+        if left > 0:
+            self._tick_timer.start(int((left - (remaining - 1)) * 1000) + 1)
+
+    def trigger_shield(self, is_active: bool):
+        """
+        Called by the main thread when a threat is detected or resolved.
+        Repeated calls with nothing new to show return without touching any window.
+        """
         if is_active:
-            # Stop any fading out that might be occurring
-            if self.fade_timer.isActive():
-                self.fade_timer.stop()
+            if not self._last_shown:
+                # Stop any fading out that might be occurring
+                self._fade_group.stop()
                 
-            self.opacity = 1.0
-            
-            # Shield ON: Show on all screens robustly
-            for shield in self.shields:
-                shield.lockout_label.setText(f"System locked for {remaining_seconds} seconds.")
-                # Re-assert geometry just in case screen resolution changed
-                shield.setGeometry(shield.screen_obj.geometry())
-                shield.setWindowOpacity(1.0)
-                shield.opacity = 1.0
-                shield.show()
-                shield.raise_()
-                shield.activateWindow()
-        else:
+                # Shield ON: Show on all screens robustly
+                for shield in self.shields:
+                    # Re-snap only if the screen resolution actually changed
+                    shield.sync_geometry()
+                    shield.setWindowOpacity(1.0)
+                    # A shield re-armed mid-fade is still mapped and on top; skip the WM round-trips
+                    if not shield._is_visible:
+                        shield.show()
+                        shield.raise_()
+                        shield._is_visible = True
+                self._activate_focus_shield()
+                self._last_shown = True
+                # Only if a threat beat the idle warm-up: cover the screen first, add the logo after
+                if not self.shields[0]._heavy_loaded:
+                    QTimer.singleShot(0, self._load_heavy_content)
+        elif self._last_shown:
             # Fade out
+            self._last_shown = False
+            self._tick_timer.stop()
+            self._unlock_timer.stop()
             self.fade_out()
 
+    def _load_heavy_content(self):
+        for shield in self.shields:
+            shield._init_heavy_content()
+
+    def _activate_focus_shield(self):
+        """
+        Activates the shield on the cursor's screen (or the primary screen), once per showing.
+        The shield only swallows keystrokes while it has focus, so this can't wait for a mouse move.
+        """
+        screen = QGuiApplication.screenAt(QCursor.pos()) or QGuiApplication.primaryScreen()
+        target = next((s for s in self.shields if s.screen_obj is screen), None)
+        if target is None and self.shields:
+            target = self.shields[0]
+        if target is not None and not target._activated:
+            target.activateWindow()
+            target._activated = True
+
     def fade_out(self):
         """Gradually fades out all shields to prevent jarring transitions."""
-        if not self.fade_timer.isActive():
-            self.opacity = 1.0
-            self.fade_timer.start(10) # 10ms intervals
-
-    def _do_fade(self):
-        self.opacity -= 0.05
-        if self.opacity <= 0.0:
-            self.opacity = 0.0
-            self.fade_timer.stop()
-            for shield in self.shields:
-                shield.setWindowOpacity(self.opacity)
-                shield.hide() # Completely hide it so clicks pass through normally
-        else:
-            for shield in self.shields:
-                shield.setWindowOpacity(self.opacity)
+        if self._fade_group.state() != QAbstractAnimation.State.Running:
+            self._fade_group.start()
+
+    def _on_fade_finished(self):
+        for shield in self.shields:
+            shield.hide() # Completely hide it so clicks pass through normally
+            shield._is_visible = False
+            shield._activated = False
 
     def hide_shield(self):
         """Immediately hides all shield windows without fade animation."""
-        if self.fade_timer.isActive():
-            self.fade_timer.stop()
-        self.opacity = 0.0
+        self._fade_group.stop()
+        self._tick_timer.stop()
+        self._unlock_timer.stop()
+        self._last_shown = False
         for shield in self.shields:
             shield.setWindowOpacity(0.0)
             shield.hide()
-
+            shield._is_visible = False
+            shield._activated = False